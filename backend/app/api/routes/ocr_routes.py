@@ -1,4 +1,4 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, status
+from fastapi import APIRouter, Request, UploadFile, File, HTTPException, status
 from typing import List, Dict, Any
 from datetime import datetime
 
@@ -9,17 +9,28 @@ import shutil
 
 from backend.app.services.ocr_service import OCRService
 
-ocr_service = OCRService()
-
 router = APIRouter()
 logger = get_logger(__name__)
 
 
+def _get_ocr_service(request: Request) -> OCRService:
+    # The lifespan hook constructs the service with warmed engines; fall
+    # back to a fresh instance when the app runs without the hook (tests).
+    service = getattr(request.app.state, "ocr_service", None)
+    if service is None:
+        service = OCRService()
+        request.app.state.ocr_service = service
+    return service
+
+
 @router.post("/process", status_code=status.HTTP_200_OK)
 async def process_documents(
+    request: Request,
     files: List[UploadFile] = File(...)
 ) -> Dict[str, Any]:
 
+    ocr_service = _get_ocr_service(request)
+
     results = []
 
     upload_dir = Path("uploads")
@@ -25,6 +25,7 @@ class Settings(BaseSettings):
     MERGED_PDF_DIR: str = "storage/merged_pdfs"
     PROCESSED_IMAGE_DIR: str = "storage/processed_images"
     JSON_TASKS_DIR: str = "storage/json_tasks"
+    OCR_CACHE_DIR: str = "storage/ocr_cache"
     LOGS_DIR: str = "logs"
 
 
@@ -34,6 +35,7 @@ class Settings(BaseSettings):
 
 
     DEFAULT_OCR_ENGINE: str = "easyocr"
+    OCR_CONCURRENCY: int = 4
     OCR_CONFIDENCE_THRESHOLD: float = 0.5
     OCR_LANGUAGE: str = "eng"
     OCR_PSM_MODE: int = 3
@@ -44,14 +46,47 @@ class Settings(BaseSettings):
     FALLBACK_OCR_ENGINE: str = "easyocr"
 
 
+    ENABLE_OCR_CACHE: bool = True
+
+
+    # Pages whose dark-pixel fraction falls below this after preprocessing
+    # are treated as blank and skip OCR entirely.
+    OCR_BLANK_PAGE_DENSITY: float = 0.005
+
+
+    ENABLE_OCR_BATCHING: bool = False
+    OCR_BATCH_MAX_SIZE: int = 16
+    OCR_BATCH_MAX_WAIT: float = 0.05
+    OCR_NATIVE_BATCH_MIN: int = 4
+
+
+    OCR_RETRY_ATTEMPTS: int = 3
+    OCR_RETRY_BASE_DELAY: float = 1.0
+    OCR_RETRY_MAX_DELAY: float = 10.0
+
+
+    ENABLE_ENGINE_WARMUP: bool = True
+    ENGINE_WARMUP_HEIGHT: int = 256
+    ENGINE_WARMUP_WIDTH: int = 256
+    OCR_PRELOAD_ENGINES: str = ""
+
+
     ENABLE_PREPROCESSING: bool = True
     ENABLE_DENOISING: bool = True
     ENABLE_DESKEWING: bool = True
     ENABLE_BINARIZATION: bool = True
     ENABLE_CONTRAST_ENHANCEMENT: bool = True
+    ENABLE_PREPROCESS_POOL: bool = True
+    PREPROCESS_POOL_WORKERS: Optional[int] = None
     DPI_CONVERSION: int = 300
 
 
+    PAGE_IMAGE_FORMAT: str = "jpg"
+    PAGE_IMAGE_QUALITY: int = 85
+    PAGE_IMAGE_GRAYSCALE: bool = True
+    ENABLE_IN_MEMORY_PIPELINE: bool = True
+
+
     DETECT_HANDWRITING: bool = True
     DETECT_TABLES: bool = True
     DETECT_MEDICAL_FORMS: bool = True
@@ -122,6 +157,7 @@ class Settings(BaseSettings):
             self.MERGED_PDF_DIR,
             self.PROCESSED_IMAGE_DIR,
             self.JSON_TASKS_DIR,
+            self.OCR_CACHE_DIR,
             self.LOGS_DIR,
         ]
 
@@ -22,7 +22,8 @@ class ImageBinarizer:
         if len(image.shape) == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
-            gray = image.copy()
+            # Thresholding writes into a fresh buffer; no input copy needed.
+            gray = image
 
         if method == "auto":
             return self._auto_binarize(gray)
@@ -40,6 +41,91 @@ class ImageBinarizer:
             self.logger.warning(f"Unknown method: {method}, using auto")
             return self._auto_binarize(gray)
 
+    def binarize_batch(
+        self,
+        image: np.ndarray,
+        methods: list,
+        window_size: int = 15
+    ) -> dict:
+        # Binarize one image with several methods while sharing the
+        # expensive intermediates: the grayscale conversion runs once, and
+        # Sauvola and Niblack reuse a single set of local mean/std maps.
+        if len(image.shape) == 3:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        else:
+            gray = image
+
+        img_f = None
+        stats = None
+        results = {}
+
+        for method in methods:
+            if method in ("sauvola", "niblack"):
+                if stats is None:
+                    img_f = gray.astype(np.float32)
+                    stats = self._local_stats(img_f, window_size)
+                mean, std = stats
+                if method == "sauvola":
+                    results[method] = self._sauvola_from_stats(img_f, mean, std)
+                else:
+                    results[method] = self._niblack_from_stats(img_f, mean, std)
+            else:
+                results[method] = self.binarize(gray, method=method)
+
+        self.logger.debug(
+            f"Batch binarization - methods: {list(results)}"
+        )
+
+        return results
+
+    def _local_stats(
+        self,
+        img_f: np.ndarray,
+        window_size: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        mean = cv2.boxFilter(
+            img_f,
+            -1,
+            (window_size, window_size),
+            normalize=True
+        )
+
+        mean_sq = cv2.boxFilter(
+            img_f * img_f,
+            -1,
+            (window_size, window_size),
+            normalize=True
+        )
+
+        std = cv2.sqrt(cv2.max(mean_sq - mean * mean, 0))
+
+        return mean, std
+
+    def _sauvola_from_stats(
+        self,
+        img_f: np.ndarray,
+        mean: np.ndarray,
+        std: np.ndarray,
+        k: float = 0.2,
+        r: float = 128.0
+    ) -> np.ndarray:
+        threshold = mean * (1 + k * ((std / r) - 1))
+
+        # CMP_GT emits the 0/255 mask directly — no boolean temporary or
+        # np.where pass over the frame.
+        return cv2.compare(img_f, threshold, cv2.CMP_GT)
+
+    def _niblack_from_stats(
+        self,
+        img_f: np.ndarray,
+        mean: np.ndarray,
+        std: np.ndarray,
+        k: float = -0.2
+    ) -> np.ndarray:
+        threshold = mean + k * std
+
+        return cv2.compare(img_f, threshold, cv2.CMP_GT)
+
     def _auto_binarize(self, image: np.ndarray) -> np.ndarray:
         mean_intensity = np.mean(image)
         std_intensity = np.std(image)
@@ -126,27 +212,14 @@ class ImageBinarizer:
             window_size += 1
 
 
-        mean = cv2.boxFilter(
-            image.astype(float),
-            -1,
-            (window_size, window_size),
-            normalize=True
-        )
-
-        mean_sq = cv2.boxFilter(
-            (image.astype(float) ** 2),
-            -1,
-            (window_size, window_size),
-            normalize=True
-        )
-
-        std = np.sqrt(mean_sq - mean ** 2)
-
-
-        threshold = mean * (1 + k * ((std / r) - 1))
+        # float32 halves the bytes moved through the box filters compared
+        # to float64 and keeps OpenCV on its vectorized kernels; the
+        # window statistics fit comfortably in single precision.
+        img_f = image.astype(np.float32)
 
+        mean, std = self._local_stats(img_f, window_size)
 
-        binary = np.where(image > threshold, 255, 0).astype(np.uint8)
+        binary = self._sauvola_from_stats(img_f, mean, std, k=k, r=r)
 
         self.logger.debug(
             f"Sauvola binarization - window: {window_size}, k: {k}, r: {r}"
@@ -164,27 +237,11 @@ class ImageBinarizer:
             window_size += 1
 
 
-        mean = cv2.boxFilter(
-            image.astype(float),
-            -1,
-            (window_size, window_size),
-            normalize=True
-        )
-
-        mean_sq = cv2.boxFilter(
-            (image.astype(float) ** 2),
-            -1,
-            (window_size, window_size),
-            normalize=True
-        )
-
-        std = np.sqrt(mean_sq - mean ** 2)
-
-
-        threshold = mean + k * std
+        img_f = image.astype(np.float32)
 
+        mean, std = self._local_stats(img_f, window_size)
 
-        binary = np.where(image > threshold, 255, 0).astype(np.uint8)
+        binary = self._niblack_from_stats(img_f, mean, std, k=k)
 
         self.logger.debug(
             f"Niblack binarization - window: {window_size}, k: {k}"
@@ -6,6 +6,11 @@ from backend.app.config import get_logger
 
 logger = get_logger(__name__)
 
+# OpenCV's T-API runs the same calls on the OpenCL backend when one is
+# available (GPU, or SIMD-tuned CPU kernels); the expensive filters wrap
+# their input in a UMat so production-sized pages take that path for free.
+_USE_OPENCL = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+
 
 class ImageDenoiser:
     def __init__(self):
@@ -34,11 +39,31 @@ class ImageDenoiser:
             self.logger.warning(f"Unknown method: {method}, using auto")
             return self._auto_denoise(image)
 
+    def denoise_batch(
+        self,
+        image: np.ndarray,
+        methods: list
+    ) -> dict:
+        # Denoise one image with several methods in a single call; the
+        # filters all consume the original frame, so the batch keeps the
+        # loop (and its logging) out of caller code.
+        results = {}
+
+        for method in methods:
+            results[method] = self.denoise(image, method=method)
+
+        self.logger.debug(
+            f"Batch denoising - methods: {list(results)}"
+        )
+
+        return results
+
     def _auto_denoise(self, image: np.ndarray) -> np.ndarray:
         if len(image.shape) == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
-            gray = image.copy()
+            # Only read by the noise estimator; a view avoids a copy.
+            gray = image
 
 
         noise_level = self._estimate_noise(gray)
@@ -106,13 +131,18 @@ class ImageDenoiser:
         sigma_color: float = 75,
         sigma_space: float = 75
     ) -> np.ndarray:
+        src = cv2.UMat(image) if _USE_OPENCL else image
+
         denoised = cv2.bilateralFilter(
-            image,
+            src,
             d,
             sigma_color,
             sigma_space
         )
 
+        if _USE_OPENCL:
+            denoised = denoised.get()
+
         self.logger.debug(
             f"Applied bilateral denoise - d: {d}, "
             f"sigma_color: {sigma_color}, sigma_space: {sigma_space}"
@@ -127,10 +157,12 @@ class ImageDenoiser:
         template_size: int = 7,
         search_size: int = 21
     ) -> np.ndarray:
+        src = cv2.UMat(image) if _USE_OPENCL else image
+
         if len(image.shape) == 2:
 
             denoised = cv2.fastNlMeansDenoising(
-                image,
+                src,
                 None,
                 h,
                 template_size,
@@ -139,7 +171,7 @@ class ImageDenoiser:
         else:
 
             denoised = cv2.fastNlMeansDenoisingColored(
-                image,
+                src,
                 None,
                 h,
                 h,
@@ -147,6 +179,9 @@ class ImageDenoiser:
                 search_size
             )
 
+        if _USE_OPENCL:
+            denoised = denoised.get()
+
         self.logger.debug(
             f"Applied NLM denoise - h: {h}, "
             f"template: {template_size}, search: {search_size}"
@@ -197,7 +232,8 @@ class ImageDenoiser:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
             is_color = True
         else:
-            gray = image.copy()
+            # Blocks are read from gray and written into a separate buffer.
+            gray = image
             is_color = False
 
 
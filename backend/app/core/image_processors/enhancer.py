@@ -32,11 +32,31 @@ class ImageEnhancer:
             self.logger.warning(f"Unknown method: {method}, using auto")
             return self._auto_enhance(image)
 
+    def enhance_batch(
+        self,
+        image: np.ndarray,
+        methods: list
+    ) -> dict:
+        # Run several enhancement methods against the same source image in
+        # one call; each method picks its own colorspace, so this amortizes
+        # the per-call dispatch rather than sharing pixel work.
+        results = {}
+
+        for method in methods:
+            results[method] = self.enhance(image, method=method)
+
+        self.logger.debug(
+            f"Batch enhancement - methods: {list(results)}"
+        )
+
+        return results
+
     def _auto_enhance(self, image: np.ndarray) -> np.ndarray:
         if len(image.shape) == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
-            gray = image.copy()
+            # Only read for statistics below; a view avoids a full-frame copy.
+            gray = image
 
 
         mean_intensity = np.mean(gray)
@@ -174,7 +194,8 @@ class ImageEnhancer:
         if len(image.shape) == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
-            gray = image.copy()
+            # clahe.apply allocates its own output; no need to copy the input.
+            gray = image
 
 
         clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
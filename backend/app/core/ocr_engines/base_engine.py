@@ -9,6 +9,11 @@ logger = get_logger(__name__)
 
 
 class BaseOCREngine(ABC):
+
+    # Engines with a native batched inference path set this to True and
+    # override process_image_batch.
+    supports_batching = False
+
     def __init__(self, language: str = "eng", **kwargs):
         self.language = language
         self.config = kwargs
@@ -42,6 +47,17 @@ class BaseOCREngine(ABC):
     def get_engine_info(self) -> Dict[str, Any]:
         pass
 
+    async def process_image_batch(
+        self,
+        image_paths: List[Path],
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        # Sequential fallback; engines with native batching override this.
+        return [
+            await self.process_image_file(image_path, **kwargs)
+            for image_path in image_paths
+        ]
+
     async def is_available(self) -> bool:
         try:
             await self.initialize()
@@ -55,7 +55,7 @@ class PaddleOCREngine(BaseOCREngine):
         except ImportError:
             return False
 
-    async def process_image(self, image: np.ndarray) -> Dict[str, Any]:
+    async def process_image(self, image: np.ndarray, **kwargs) -> Dict[str, Any]:
         if self.ocr is None:
             await self.initialize()
 
@@ -148,14 +148,14 @@ class PaddleOCREngine(BaseOCREngine):
             self.logger.error(f"PaddleOCR processing failed: {e}")
             raise RuntimeError(f"PaddleOCR processing error: {str(e)}")
 
-    async def process_image_file(self, image_path: Path) -> Dict[str, Any]:
+    async def process_image_file(self, image_path: Path, **kwargs) -> Dict[str, Any]:
         try:
             image = cv2.imread(str(image_path))
 
             if image is None:
                 raise ValueError(f"Failed to load image: {image_path}")
 
-            return await self.process_image(image)
+            return await self.process_image(image, **kwargs)
 
         except Exception as e:
             self.logger.error(f"Failed to load image: {e}")
@@ -4,6 +4,7 @@ from contextlib import asynccontextmanager
 
 from backend.app.config import settings, get_logger
 from backend.app.api.routes import ocr_routes, health_routes
+from backend.app.services.ocr_service import OCRService
 from backend.app.middleware.error_handler import add_exception_handlers
 from backend.app.middleware.request_logger import RequestLoggingMiddleware
 from fastapi.middleware.cors import CORSMiddleware
@@ -13,9 +14,36 @@ logger = get_logger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    print("Startup started")
+    logger.info("Application startup")
+
+    # Construct the service and load models now so the first request after a
+    # restart doesn't pay the multi-second cold start.
+    ocr_service = OCRService()
+
+    preload = [(settings.DEFAULT_OCR_ENGINE, settings.OCR_LANGUAGE)]
+    for entry in settings.OCR_PRELOAD_ENGINES.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        engine_name, _, language = entry.partition(":")
+        preload.append((engine_name, language or settings.OCR_LANGUAGE))
+
+    for engine_name, language in preload:
+        try:
+            await ocr_service._get_engine(engine_name, language)
+            logger.info(
+                f"Engine preloaded | engine={engine_name} | language={language}"
+            )
+        except Exception as e:
+            logger.warning(
+                f"Engine preload failed | engine={engine_name} | error={e}"
+            )
+
+    app.state.ocr_service = ocr_service
+
     yield
-    print("Shutdown")
+
+    logger.info("Application shutdown")
 
 
 
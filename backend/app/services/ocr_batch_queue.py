@@ -0,0 +1,107 @@
+from typing import List, Tuple
+from pathlib import Path
+from collections import defaultdict
+import asyncio
+import time
+
+from backend.app.config import get_logger, settings
+from backend.app.core.ocr_engines.base_engine import BaseOCREngine
+
+logger = get_logger(__name__)
+
+
+class OCRBatchQueue:
+    """Aggregates concurrent single-image OCR requests into batched engine calls.
+
+    Requests from independent callers are queued and dispatched together once
+    max_batch_size items have accumulated or max_wait seconds have elapsed,
+    whichever comes first. Batching keeps GPU-backed engines saturated under
+    multi-tenant load at the cost of a small bounded tail latency.
+    """
+
+    def __init__(
+        self,
+        engine: BaseOCREngine,
+        max_batch_size: int = None,
+        max_wait: float = None
+    ):
+        self.logger = logger
+        self.engine = engine
+        self.max_batch_size = max_batch_size or settings.OCR_BATCH_MAX_SIZE
+        self.max_wait = max_wait if max_wait is not None else settings.OCR_BATCH_MAX_WAIT
+
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: asyncio.Task = None
+
+        self.logger.info(
+            f"OCR batch queue created | engine={engine.__class__.__name__} | "
+            f"max_batch_size={self.max_batch_size} | max_wait={self.max_wait}"
+        )
+
+    async def submit(self, image_path: Path, **kwargs):
+        loop = asyncio.get_running_loop()
+
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._dispatch_loop())
+
+        future = loop.create_future()
+        await self._queue.put((image_path, kwargs, future))
+
+        return await future
+
+    async def _collect_batch(self) -> List[Tuple]:
+        items = [await self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(items) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                items.append(
+                    await asyncio.wait_for(self._queue.get(), remaining)
+                )
+            except asyncio.TimeoutError:
+                break
+
+        return items
+
+    async def _dispatch_loop(self):
+        while True:
+            items = await self._collect_batch()
+
+            # Submitters pass per-call kwargs (psm, config, ...), so one
+            # caller's options must never apply to another's pages: the
+            # batch is partitioned by kwargs and each distinct set
+            # dispatches as its own engine call.
+            groups = defaultdict(list)
+            for item in items:
+                _, kwargs, _ = item
+                key = tuple(sorted((k, repr(v)) for k, v in kwargs.items()))
+                groups[key].append(item)
+
+            self.logger.debug(
+                f"Dispatching OCR batch | size={len(items)} | "
+                f"kwarg_groups={len(groups)}"
+            )
+
+            for group in groups.values():
+                image_paths = [image_path for image_path, _, _ in group]
+
+                try:
+                    results = await self.engine.process_image_batch(
+                        image_paths,
+                        **group[0][1]
+                    )
+                except Exception as e:
+                    self.logger.error(
+                        f"OCR batch dispatch failed | size={len(group)} | error={e}"
+                    )
+                    for _, _, future in group:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                for (_, _, future), result in zip(group, results):
+                    if not future.done():
+                        future.set_result(result)
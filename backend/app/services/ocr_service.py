@@ -1,6 +1,14 @@
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import asyncio
+import hashlib
+import itertools
+import os
+from collections import defaultdict
+
+import orjson
+
+import numpy as np
 
 from backend.app.utils.json_utils import save_ocr_json
 from backend.app.config import get_logger, settings
@@ -12,11 +20,40 @@ from backend.app.utils.exceptions import (
 from backend.app.services.pdf_service import PDFService
 from backend.app.services.preprocessing_service import PreprocessingService
 from backend.app.core.ocr_engines import OCREngineFactory, create_ocr_engine
+from backend.app.services.ocr_batch_queue import OCRBatchQueue
 from backend.app.utils.file_utils import load_image, ensure_directory
 
 logger = get_logger(__name__)
 
 
+# Engine instances are heavy (EasyOCR loads ~100MB of weights) and FastAPI
+# may construct services per request, so cache them process-wide. The
+# per-key locks stop concurrent first requests from each loading a model.
+_ENGINE_CACHE: Dict[str, Any] = {}
+_ENGINE_LOCKS: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+# Document types where color carries signal (stamps, seals, holograms);
+# everything else renders grayscale straight from the PDF.
+COLOR_DOCUMENT_TYPES = frozenset({"stamped", "id_card"})
+
+# Failure signatures worth retrying: rate limits, timeouts and recoverable
+# GPU memory pressure. Parse/format errors are permanent and fail fast.
+_TRANSIENT_ERROR_MARKERS = (
+    "rate limit",
+    "quota",
+    "timeout",
+    "timed out",
+    "429",
+    "out of memory",
+    "temporarily unavailable",
+)
+
+
+def _is_transient_error(error: Exception) -> bool:
+    message = str(error).lower()
+    return any(marker in message for marker in _TRANSIENT_ERROR_MARKERS)
+
+
 class OCRService:
 
     def __init__(self):
@@ -24,7 +61,9 @@ class OCRService:
         self.default_engine = settings.DEFAULT_OCR_ENGINE
         self.pdf_service = PDFService()
         self.preprocessing_service = PreprocessingService()
-        self._engine_cache = {}
+        self._engine_cache = _ENGINE_CACHE
+        self._batch_queues = {}
+        self._cache_dir = settings.get_absolute_path(settings.OCR_CACHE_DIR)
 
         self.logger.info(
             f"OCR Service initialized | default_engine={self.default_engine}"
@@ -47,14 +86,44 @@ class OCRService:
         )
 
         try:
+            pdf_cache_key = None
+            if settings.ENABLE_OCR_CACHE:
+                pdf_cache_key = self._pdf_cache_key(
+                    pdf_path, engine, language, preprocess, document_type
+                )
+                cached = self._ocr_cache_get(pdf_cache_key)
+                if cached is not None:
+                    self.logger.info(
+                        f"PDF result served from cache | path={pdf_path}"
+                    )
+                    return cached
+
             if output_dir is None:
                 output_dir = settings.get_absolute_path(settings.PROCESSED_IMAGE_DIR)
             ensure_directory(output_dir)
 
-            is_scanned = await self.pdf_service.is_pdf_scanned(pdf_path)
+            # One fitz.open per request: scan detection, text extraction and
+            # page rendering all share the same document handle instead of
+            # re-parsing the xref table per stage.
+            pdf_doc = self.pdf_service.open_pdf(pdf_path)
+        except Exception as e:
+            self.logger.error(
+                f"PDF OCR failed | path={pdf_path} | error={str(e)}",
+                exc_info=True
+            )
+            raise OCRProcessingError(
+                message=f"Failed to process PDF: {str(e)}",
+                details={
+                    "pdf_path": str(pdf_path),
+                    "error": str(e)
+                }
+            )
+
+        try:
+            is_scanned = self.pdf_service._is_scanned_doc(pdf_doc)
 
             if not is_scanned:
-                text_result = await self.pdf_service.extract_text_from_pdf(pdf_path)
+                text_result = self.pdf_service._extract_text_doc(pdf_doc, pdf_path)
 
                 final_result = {
                     "pdf_path": str(pdf_path),
@@ -70,34 +139,52 @@ class OCRService:
                 # ✅ SAVE JSON
                 json_path = save_ocr_json(final_result, pdf_path.stem)
 
-                return {
+                response = {
                     "message": "PDF text extracted successfully",
                     "json_path": json_path,
                     "data": final_result
                 }
 
-            image_paths = await self.pdf_service.convert_pdf_to_images(
-                pdf_path,
-                output_dir,
-                dpi=settings.DPI_CONVERSION
-            )
+                if pdf_cache_key is not None:
+                    self._ocr_cache_put(pdf_cache_key, response)
 
-            if preprocess:
-                processed_paths = []
-                for img_path in image_paths:
-                    processed_path = await self.preprocessing_service.preprocess_for_ocr(
-                        img_path,
-                        document_type=document_type
-                    )
-                    processed_paths.append(processed_path)
-            else:
-                processed_paths = image_paths
+                return response
 
-            ocr_results = await self.process_images(
-                processed_paths,
-                engine=engine,
-                language=language
-            )
+            grayscale = document_type not in COLOR_DOCUMENT_TYPES
+
+            if settings.ENABLE_IN_MEMORY_PIPELINE:
+                ocr_results = await self._process_scanned_pdf_in_memory(
+                    pdf_path,
+                    engine=engine,
+                    language=language,
+                    preprocess=preprocess,
+                    grayscale=grayscale,
+                    pdf_doc=pdf_doc
+                )
+            else:
+                image_paths = await self.pdf_service.convert_pdf_to_images(
+                    pdf_path,
+                    output_dir,
+                    dpi=settings.DPI_CONVERSION,
+                    grayscale=grayscale
+                )
+
+                if preprocess:
+                    processed_paths = []
+                    for img_path in image_paths:
+                        processed_path = await self.preprocessing_service.preprocess_for_ocr(
+                            img_path,
+                            document_type=document_type
+                        )
+                        processed_paths.append(processed_path)
+                else:
+                    processed_paths = image_paths
+
+                ocr_results = await self.process_images(
+                    processed_paths,
+                    engine=engine,
+                    language=language
+                )
 
             result = self._combine_page_results(
                 pdf_path,
@@ -108,12 +195,17 @@ class OCRService:
             # ✅ SAVE JSON HERE
             json_path = save_ocr_json(result, pdf_path.stem)
 
-            return {
+            response = {
                 "message": "OCR completed successfully",
                 "json_path": json_path,
                 "data": result
             }
 
+            if pdf_cache_key is not None:
+                self._ocr_cache_put(pdf_cache_key, response)
+
+            return response
+
         except Exception as e:
             self.logger.error(
                 f"PDF OCR failed | path={pdf_path} | error={str(e)}",
@@ -126,6 +218,111 @@ class OCRService:
                     "error": str(e)
                 }
             )
+        finally:
+            pdf_doc.close()
+
+    async def _process_scanned_pdf_in_memory(
+        self,
+        pdf_path: Path,
+        engine: Optional[str] = None,
+        language: str = "eng",
+        preprocess: bool = True,
+        grayscale: Optional[bool] = None,
+        pdf_doc=None
+    ) -> List[Dict[str, Any]]:
+        # Pixmap bytes flow straight into preprocessing and OCR as ndarrays;
+        # no per-page image encode/decode or disk round-trip.
+        ocr_engine = await self._get_engine(engine, language)
+
+        # Same machinery as the disk path: pages dispatch concurrently
+        # under the OCR_CONCURRENCY semaphore and transient engine
+        # failures go through the retry wrapper.
+        semaphore = asyncio.Semaphore(settings.OCR_CONCURRENCY)
+
+        async def process_one(page_number, page_image):
+            async with semaphore:
+                try:
+                    binarized = False
+                    if preprocess:
+                        # to_thread keeps the OpenCV work off the event
+                        # loop; cv2 releases the GIL so other pages make
+                        # progress.
+                        page_image, prep_metadata = await asyncio.to_thread(
+                            self.preprocessing_service.preprocess_image_array,
+                            page_image
+                        )
+
+                        # Explicit pipeline state for the engine: only a
+                        # page the binarizer actually ran on may skip
+                        # Tesseract's inverted-copy probe.
+                        binarized = any(
+                            step.startswith('binarize')
+                            for step in prep_metadata.get('steps_applied', ())
+                        )
+
+                        # Archives carry plenty of blank pages; a density
+                        # check costs one pass over the page and skips the
+                        # far more expensive model inference.
+                        if self._is_blank_page(page_image):
+                            self.logger.debug(
+                                f"Blank page skipped | pdf_path={pdf_path} | page={page_number}"
+                            )
+                            blank_result = self._create_blank_result(pdf_path)
+                            blank_result['page_number'] = page_number
+                            return blank_result
+
+                    result = await self._run_ocr_with_retry(
+                        lambda _label: ocr_engine.process_image(
+                            page_image, binarized=binarized
+                        ),
+                        f"{pdf_path}#page={page_number}"
+                    )
+                    result['page_number'] = page_number
+                    return result
+                except Exception as e:
+                    error_result = self._create_error_result(pdf_path, str(e))
+                    error_result['page_number'] = page_number
+                    return error_result
+
+        if pdf_doc is not None:
+            doc = pdf_doc
+            close_doc = False
+        else:
+            doc = await asyncio.to_thread(
+                self.pdf_service.open_pdf, pdf_path, True
+            )
+            close_doc = True
+
+        try:
+            # Render lazily in concurrency-sized chunks: only one chunk of
+            # page pixmaps is alive at a time instead of the whole
+            # document's, which matters for archive-sized PDFs.
+            page_iter = self.pdf_service._iter_pages_doc(
+                doc,
+                dpi=settings.DPI_CONVERSION,
+                grayscale=grayscale
+            )
+            chunk_size = max(settings.OCR_CONCURRENCY, 1)
+
+            results = []
+            page_number = 0
+            while True:
+                chunk = await asyncio.to_thread(
+                    lambda: list(itertools.islice(page_iter, chunk_size))
+                )
+                if not chunk:
+                    break
+
+                results.extend(await asyncio.gather(*[
+                    process_one(page_number + offset + 1, page_image)
+                    for offset, page_image in enumerate(chunk)
+                ]))
+                page_number += len(chunk)
+        finally:
+            if close_doc:
+                doc.close()
+
+        return results
 
     async def process_images(
         self,
@@ -143,20 +340,70 @@ class OCRService:
 
         try:
             ocr_engine = await self._get_engine(engine, language)
-            results = []
 
-            for i, image_path in enumerate(image_paths, 1):
-                try:
-                    result = await ocr_engine.process_image_file(image_path)
-                    result['image_path'] = str(image_path)
-                    result['page_number'] = i
-                    results.append(result)
-                except Exception as e:
-                    results.append(
-                        self._create_error_result(image_path, str(e))
-                    )
+            engine_name = (engine or self.default_engine).lower().strip()
+
+            # Engines with a native batched API process the whole page set
+            # in one call, amortizing GPU/kernel launch overhead. Below
+            # OCR_NATIVE_BATCH_MIN images the stacking/resize overhead
+            # outweighs what batching saves, so small sets stay on the
+            # per-image path.
+            if (
+                ocr_engine.supports_batching
+                and not settings.ENABLE_OCR_BATCHING
+                and len(image_paths) >= settings.OCR_NATIVE_BATCH_MIN
+            ):
+                return await self._process_images_native_batch(
+                    ocr_engine, image_paths, engine_name, language
+                )
+
+            if settings.ENABLE_OCR_BATCHING:
+                batch_queue = self._get_batch_queue(ocr_engine)
+                run_ocr = batch_queue.submit
+            else:
+                run_ocr = ocr_engine.process_image_file
 
-            return results
+            # Dispatch pages concurrently under a semaphore; gather preserves
+            # page order positionally. parallel=False degrades to a
+            # one-permit semaphore, i.e. sequential processing.
+            semaphore = asyncio.Semaphore(
+                settings.OCR_CONCURRENCY if parallel else 1
+            )
+            create_error_result = self._create_error_result
+
+            async def process_one(page_number, image_path):
+                async with semaphore:
+                    try:
+                        cache_key = None
+                        if settings.ENABLE_OCR_CACHE:
+                            cache_key = self._ocr_cache_key(
+                                image_path, engine_name, language
+                            )
+                            cached = self._ocr_cache_get(cache_key)
+                            if cached is not None:
+                                cached['image_path'] = str(image_path)
+                                cached['page_number'] = page_number
+                                return cached
+
+                        result = await self._run_ocr_with_retry(
+                            run_ocr, image_path
+                        )
+                        result['image_path'] = str(image_path)
+                        result['page_number'] = page_number
+
+                        if cache_key is not None:
+                            self._ocr_cache_put(cache_key, result)
+
+                        return result
+                    except Exception as e:
+                        return create_error_result(image_path, str(e))
+
+            return await asyncio.gather(
+                *[
+                    process_one(i, image_path)
+                    for i, image_path in enumerate(image_paths, 1)
+                ]
+            )
 
         except Exception as e:
             raise OCRProcessingError(
@@ -178,12 +425,196 @@ class OCRService:
         if cache_key in self._engine_cache:
             return self._engine_cache[cache_key]
 
-        ocr_engine = create_ocr_engine(engine_name, language)
-        await ocr_engine.initialize()
+        # Double-checked locking: only the first caller for this key pays
+        # the model load; the rest wait on the lock and hit the cache.
+        async with _ENGINE_LOCKS[cache_key]:
+            if cache_key in self._engine_cache:
+                return self._engine_cache[cache_key]
+
+            ocr_engine = create_ocr_engine(engine_name, language)
+            await ocr_engine.initialize()
+
+            if settings.ENABLE_ENGINE_WARMUP:
+                await self._warmup_engine(ocr_engine)
+
+            self._engine_cache[cache_key] = ocr_engine
+
+            return ocr_engine
 
-        self._engine_cache[cache_key] = ocr_engine
+    async def _warmup_engine(self, ocr_engine) -> None:
+        # The first inference on a freshly loaded model pays lazy kernel
+        # compilation / cuDNN autotuning; run a dummy pass now so the first
+        # real page hits steady-state latency.
+        try:
+            dummy = np.zeros(
+                (settings.ENGINE_WARMUP_HEIGHT, settings.ENGINE_WARMUP_WIDTH, 3),
+                dtype=np.uint8
+            )
+            await ocr_engine.process_image(dummy)
 
-        return ocr_engine
+            self.logger.info(
+                f"Engine warmup completed | engine={ocr_engine.__class__.__name__}"
+            )
+        except Exception as e:
+            self.logger.warning(
+                f"Engine warmup failed, continuing | "
+                f"engine={ocr_engine.__class__.__name__} | error={e}"
+            )
+
+    async def _run_ocr_with_retry(self, run_ocr, image_path: Path):
+        # Retries run inside the concurrency semaphore, so backed-off pages
+        # don't storm the engine while other pages proceed.
+        attempt = 1
+
+        while True:
+            try:
+                return await run_ocr(image_path)
+            except Exception as e:
+                if (
+                    attempt >= settings.OCR_RETRY_ATTEMPTS
+                    or not _is_transient_error(e)
+                ):
+                    raise
+
+                delay = min(
+                    settings.OCR_RETRY_BASE_DELAY * (2 ** (attempt - 1)),
+                    settings.OCR_RETRY_MAX_DELAY
+                )
+
+                self.logger.warning(
+                    f"Transient OCR failure, retrying | path={image_path} | "
+                    f"attempt={attempt}/{settings.OCR_RETRY_ATTEMPTS} | "
+                    f"delay={delay}s | error={e}"
+                )
+
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _process_images_native_batch(
+        self,
+        ocr_engine,
+        image_paths: List[Path],
+        engine_name: str,
+        language: str
+    ) -> List[Dict[str, Any]]:
+        results = [None] * len(image_paths)
+        cache_keys = [None] * len(image_paths)
+        pending = []
+
+        for i, image_path in enumerate(image_paths):
+            if settings.ENABLE_OCR_CACHE:
+                cache_keys[i] = self._ocr_cache_key(
+                    image_path, engine_name, language
+                )
+                cached = self._ocr_cache_get(cache_keys[i])
+                if cached is not None:
+                    cached['image_path'] = str(image_path)
+                    cached['page_number'] = i + 1
+                    results[i] = cached
+                    continue
+
+            pending.append(i)
+
+        if pending:
+            try:
+                batch_results = await ocr_engine.process_image_batch(
+                    [image_paths[i] for i in pending]
+                )
+            except Exception as e:
+                for i in pending:
+                    results[i] = self._create_error_result(
+                        image_paths[i], str(e)
+                    )
+            else:
+                for i, result in zip(pending, batch_results):
+                    result['image_path'] = str(image_paths[i])
+                    result['page_number'] = i + 1
+                    results[i] = result
+
+                    if cache_keys[i] is not None:
+                        self._ocr_cache_put(cache_keys[i], result)
+
+        return results
+
+    def _pdf_cache_key(
+        self,
+        pdf_path: Path,
+        engine: Optional[str],
+        language: str,
+        preprocess: bool,
+        document_type: str
+    ) -> str:
+        # Content hash for reasonably sized files; for very large PDFs a
+        # size/mtime fingerprint avoids reading hundreds of MB just to key
+        # the cache.
+        stat = pdf_path.stat()
+        if stat.st_size < 50 * 1024 * 1024:
+            fingerprint = hashlib.blake2b(
+                pdf_path.read_bytes(),
+                digest_size=16
+            ).hexdigest()
+        else:
+            fingerprint = f"{stat.st_size}_{stat.st_mtime_ns}_{pdf_path.name}"
+
+        engine_name = (engine or self.default_engine).lower().strip()
+        return (
+            f"pdf_{fingerprint}_{engine_name}_{language}_"
+            f"{int(preprocess)}_{document_type}"
+        )
+
+    def _ocr_cache_key(
+        self,
+        image_path: Path,
+        engine_name: str,
+        language: str
+    ) -> str:
+        # Hash the (preprocessed) image bytes so the key is tolerant of
+        # upstream DPI changes but sensitive to preprocessing parameters.
+        digest = hashlib.blake2b(
+            image_path.read_bytes(),
+            digest_size=16
+        ).hexdigest()
+        return f"{digest}_{engine_name}_{language}"
+
+    def _ocr_cache_get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        cache_file = self._cache_dir / f"{cache_key}.json"
+
+        if not cache_file.exists():
+            return None
+
+        try:
+            result = orjson.loads(cache_file.read_bytes())
+
+            self.logger.debug(f"OCR cache hit | key={cache_key}")
+            return result
+        except (OSError, orjson.JSONDecodeError) as e:
+            self.logger.warning(
+                f"OCR cache read failed, reprocessing | key={cache_key} | error={e}"
+            )
+            return None
+
+    def _ocr_cache_put(self, cache_key: str, result: Dict[str, Any]) -> None:
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file = self._cache_dir / f"{cache_key}.json"
+
+            # Write-then-rename so a concurrent reader never sees a
+            # truncated entry; os.replace is atomic on the same filesystem.
+            tmp_file = cache_file.with_suffix(f".tmp{os.getpid()}")
+            tmp_file.write_bytes(
+                orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY)
+            )
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError) as e:
+            self.logger.warning(
+                f"OCR cache write failed | key={cache_key} | error={e}"
+            )
+
+    def _get_batch_queue(self, ocr_engine) -> OCRBatchQueue:
+        if ocr_engine not in self._batch_queues:
+            self._batch_queues[ocr_engine] = OCRBatchQueue(ocr_engine)
+
+        return self._batch_queues[ocr_engine]
 
     def _combine_page_results(
         self,
@@ -192,25 +623,30 @@ class OCRService:
         is_scanned: bool
     ) -> Dict[str, Any]:
 
-        full_text = "\n\n".join(
-            f"--- Page {i+1} ---\n{result.get('text','')}"
-            for i, result in enumerate(page_results)
-        )
-
-        total_chars = sum(
-            result.get('character_count', 0)
-            for result in page_results
-        )
-
-        total_words = sum(
-            result.get('word_count', 0)
-            for result in page_results
-        )
-
-        avg_confidence = sum(
-            result.get('confidence', 0)
-            for result in page_results
-        ) / len(page_results) if page_results else 0.0
+        # One pass over page_results collects the text parts and the numeric
+        # stats together; the reductions then run at C level on the array.
+        text_parts = []
+        stat_rows = []
+
+        for i, result in enumerate(page_results):
+            text_parts.append(f"--- Page {i+1} ---\n{result.get('text','')}")
+            stat_rows.append((
+                result.get('character_count', 0),
+                result.get('word_count', 0),
+                result.get('confidence', 0.0)
+            ))
+
+        full_text = "\n\n".join(text_parts)
+
+        if stat_rows:
+            stats = np.asarray(stat_rows, dtype=np.float64)
+            total_chars = int(stats[:, 0].sum())
+            total_words = int(stats[:, 1].sum())
+            avg_confidence = float(stats[:, 2].mean())
+        else:
+            total_chars = 0
+            total_words = 0
+            avg_confidence = 0.0
 
         return {
             "pdf_path": str(pdf_path),
@@ -226,6 +662,28 @@ class OCRService:
             "language": page_results[0].get('language') if page_results else None
         }
 
+    @staticmethod
+    def _is_blank_page(image: np.ndarray) -> bool:
+        if image.ndim == 3:
+            # A cheap max over channels beats a full grayscale convert
+            # for a yes/no density question.
+            image = image.max(axis=2)
+
+        dark_fraction = np.count_nonzero(image < 128) / image.size
+        return dark_fraction < settings.OCR_BLANK_PAGE_DENSITY
+
+    def _create_blank_result(self, image_path: Path) -> Dict[str, Any]:
+        return {
+            "image_path": str(image_path),
+            "text": "",
+            "confidence": 0.0,
+            "word_count": 0,
+            "character_count": 0,
+            "words": [],
+            "is_blank": True,
+            "success": True
+        }
+
     def _create_error_result(
         self,
         image_path: Path,
@@ -1,6 +1,12 @@
 from typing import List, Optional, Dict, Any
 from pathlib import Path
+import asyncio
+import io
+import os
 import fitz
+import numpy as np
+import orjson
+from PIL import Image
 from backend.app.config import get_logger, settings
 from backend.app.utils.exceptions import (
     PDFException,
@@ -19,6 +25,7 @@ class PDFService:
     def __init__(self):
         self.logger = logger
         self.dpi = settings.DPI_CONVERSION
+        self._cache_dir = settings.get_absolute_path(settings.OCR_CACHE_DIR)
 
     async def merge_pdfs(self, pdf_paths: List[Path], output_path: Path) -> Path:
         if not pdf_paths:
@@ -84,18 +91,95 @@ class PDFService:
                 details={"input_files": len(pdf_paths), "error": str(e)}
             )
 
+    async def merge_pdf_streams(self, pdf_streams: List[bytes]) -> bytes:
+        """Merge in-memory PDFs and return the merged bytes, so callers
+        that already hold the documents as bytes skip the write-reopen
+        round-trip through disk entirely."""
+        if not pdf_streams:
+            raise PDFMergeError(
+                message="No PDF streams provided for merging",
+                details={"pdf_count": 0}
+            )
+
+        self.logger.info(f"Merging PDF streams | stream_count={len(pdf_streams)}")
+
+        def _merge() -> bytes:
+            merged_pdf = fitz.open()
+            total_pages = 0
+
+            for i, stream in enumerate(pdf_streams, 1):
+                try:
+                    pdf_doc = fitz.open("pdf", stream)
+
+                    if pdf_doc.is_encrypted:
+                        self.logger.warning(
+                            f"PDF stream is password protected, skipping | index={i}"
+                        )
+                        pdf_doc.close()
+                        continue
+
+                    merged_pdf.insert_pdf(pdf_doc)
+                    total_pages += pdf_doc.page_count
+                    pdf_doc.close()
+
+                except Exception as e:
+                    self.logger.error(
+                        f"Failed to process PDF stream | index={i} | error={e}"
+                    )
+                    continue
+
+            if total_pages == 0:
+                merged_pdf.close()
+                raise PDFMergeError(
+                    message="No pages were merged",
+                    details={"input_streams": len(pdf_streams), "total_pages": 0}
+                )
+
+            merged_bytes = merged_pdf.tobytes()
+            merged_pdf.close()
+            return merged_bytes
+
+        try:
+            merged_bytes = await asyncio.to_thread(_merge)
+
+        except PDFMergeError:
+            raise
+        except Exception as e:
+            self.logger.error(f"PDF stream merge failed | error={e}", exc_info=True)
+            raise PDFMergeError(
+                message=f"Failed to merge PDF streams: {str(e)}",
+                details={"input_streams": len(pdf_streams), "error": str(e)}
+            )
+
+        self.logger.info(
+            f"PDF stream merge completed | input_streams={len(pdf_streams)} | "
+            f"merged_size={len(merged_bytes)}"
+        )
+
+        return merged_bytes
+
     async def convert_pdf_to_images(
         self,
         pdf_path: Path,
         output_dir: Path,
         dpi: Optional[int] = None,
-        image_format: str = "png"
+        image_format: Optional[str] = None,
+        grayscale: Optional[bool] = None
     ) -> List[Path]:
 
         if dpi is None:
             dpi = self.dpi
 
-        self.logger.info(f"Converting PDF to images | pdf_path={pdf_path} | dpi={dpi} | format={image_format}")
+        if image_format is None:
+            image_format = settings.PAGE_IMAGE_FORMAT
+
+        if grayscale is None:
+            grayscale = settings.PAGE_IMAGE_GRAYSCALE
+
+        self.logger.info(
+            f"Converting PDF to images | pdf_path={pdf_path} | dpi={dpi} | "
+            f"format={image_format} | grayscale={grayscale}"
+        )
 
         try:
             if not pdf_path.exists():
@@ -122,26 +206,72 @@ class PDFService:
 
             ensure_directory(output_dir)
 
+            page_count = pdf_doc.page_count
+            pdf_doc.close()
+
             zoom = dpi / 72.0
             mat = fitz.Matrix(zoom, zoom)
 
-            image_paths = []
-
-            for page_num in range(pdf_doc.page_count):
-                self.logger.debug(f"Converting page {page_num + 1}/{pdf_doc.page_count}")
-
-                page = pdf_doc[page_num]
-                pix = page.get_pixmap(matrix=mat, alpha=False)
-
-                output_filename = f"{pdf_path.stem}_page_{page_num + 1:04d}.{image_format}"
-                output_path = output_dir / output_filename
+            # OCR engines read grayscale just as accurately as RGB, and an
+            # 8-bit JPEG page is a fraction of the bytes of a 24-bit PNG.
+            colorspace = fitz.csGRAY if grayscale else fitz.csRGB
 
-                pix.save(str(output_path))
-                image_paths.append(output_path)
-
-                self.logger.debug(f"Saved page {page_num + 1} to {output_path}")
-
-            pdf_doc.close()
+            def _render_page(page_num: int) -> Path:
+                # get_pixmap and pix.save release the GIL, but pages must not
+                # be shared across threads — each worker opens its own
+                # (memory-mapped, cheap) document handle.
+                worker_doc = fitz.open(pdf_path)
+                try:
+                    page = worker_doc[page_num]
+                    pix = page.get_pixmap(
+                        matrix=mat, colorspace=colorspace, alpha=False
+                    )
+
+                    output_filename = f"{pdf_path.stem}_page_{page_num + 1:04d}.{image_format}"
+                    output_path = output_dir / output_filename
+
+                    if image_format in ("jpg", "jpeg"):
+                        pix.save(
+                            str(output_path),
+                            jpg_quality=settings.PAGE_IMAGE_QUALITY
+                        )
+                    elif image_format == "webp":
+                        # Pixmap.save has no WebP encoder; wrap the raw
+                        # samples in PIL without a copy. method=0 favors
+                        # encode speed — these files are ephemeral OCR input.
+                        mode = "L" if pix.n == 1 else "RGB"
+                        Image.frombuffer(
+                            mode,
+                            (pix.width, pix.height),
+                            pix.samples,
+                            "raw",
+                            mode,
+                            0,
+                            1
+                        ).save(
+                            output_path,
+                            format="WEBP",
+                            quality=settings.PAGE_IMAGE_QUALITY,
+                            method=0
+                        )
+                    else:
+                        pix.save(str(output_path))
+
+                    return output_path
+                finally:
+                    worker_doc.close()
+
+            semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
+            async def _render_with_limit(page_num: int) -> Path:
+                async with semaphore:
+                    return await asyncio.to_thread(_render_page, page_num)
+
+            image_paths = list(
+                await asyncio.gather(
+                    *[_render_with_limit(i) for i in range(page_count)]
+                )
+            )
 
             self.logger.info(
                 f"PDF to images conversion completed | pdf_path={pdf_path} | pages_converted={len(image_paths)} | dpi={dpi}"
@@ -161,57 +291,163 @@ class PDFService:
                 details={"pdf_path": str(pdf_path), "error": str(e)}
             )
 
-    async def extract_text_from_pdf(self, pdf_path: Path) -> Dict[str, Any]:
-        self.logger.info(f"Extracting text from PDF | pdf_path={pdf_path}")
+    async def render_pages(
+        self,
+        pdf_path: Path,
+        dpi: Optional[int] = None,
+        grayscale: Optional[bool] = None
+    ) -> List[np.ndarray]:
+        """Rasterize pages straight into ndarrays, skipping the PNG/JPEG
+        encode-decode round-trip that convert_pdf_to_images pays per page."""
 
-        try:
-            if not pdf_path.exists():
-                raise PDFConversionError(
-                    message=f"PDF file not found: {pdf_path}",
-                    details={"path": str(pdf_path)}
-                )
+        if dpi is None:
+            dpi = self.dpi
 
-            pdf_doc = fitz.open(pdf_path)
+        if grayscale is None:
+            grayscale = settings.PAGE_IMAGE_GRAYSCALE
 
-            if pdf_doc.is_encrypted:
+        self.logger.info(
+            f"Rendering PDF pages to memory | pdf_path={pdf_path} | dpi={dpi} | grayscale={grayscale}"
+        )
+
+        try:
+            pdf_doc = self.open_pdf(pdf_path, require_pages=True)
+            try:
+                pages = self._render_pages_doc(pdf_doc, dpi, grayscale)
+            finally:
                 pdf_doc.close()
-                raise PDFPasswordProtectedError(
-                    message=f"PDF is password protected: {pdf_path}"
-                )
 
-            pages_text = []
-            total_chars = 0
+            self.logger.info(
+                f"In-memory page rendering completed | pdf_path={pdf_path} | pages_rendered={len(pages)} | dpi={dpi}"
+            )
 
-            for page_num in range(pdf_doc.page_count):
-                page = pdf_doc[page_num]
-                text = page.get_text()
+            return pages
 
-                pages_text.append({
-                    "page_number": page_num + 1,
-                    "text": text,
-                    "char_count": len(text)
-                })
+        except (PDFConversionError, PDFPasswordProtectedError, PDFEmptyError):
+            raise
+        except Exception as e:
+            self.logger.error(
+                f"In-memory page rendering failed | pdf_path={pdf_path} | error={e}",
+                exc_info=True
+            )
+            raise PDFConversionError(
+                message=f"Failed to render PDF pages: {str(e)}",
+                details={"pdf_path": str(pdf_path), "error": str(e)}
+            )
+
+    def open_pdf(
+        self,
+        pdf_path: Path,
+        require_pages: bool = False
+    ) -> fitz.Document:
+        """Open and validate a PDF once so callers can share the document
+        handle across scan detection, text extraction and rendering instead
+        of re-parsing the xref table per stage."""
+
+        if not pdf_path.exists():
+            raise PDFConversionError(
+                message=f"PDF file not found: {pdf_path}",
+                details={"path": str(pdf_path)}
+            )
 
-                total_chars += len(text)
+        pdf_doc = fitz.open(pdf_path)
 
-            full_text = "\n\n".join(
-                f"--- Page {p['page_number']} ---\n{p['text']}"
-                for p in pages_text
+        if pdf_doc.is_encrypted:
+            pdf_doc.close()
+            raise PDFPasswordProtectedError(
+                message=f"PDF is password protected: {pdf_path}",
+                details={"path": str(pdf_path)}
             )
 
+        if require_pages and pdf_doc.page_count == 0:
             pdf_doc.close()
+            raise PDFEmptyError(
+                message=f"PDF has no pages: {pdf_path}",
+                details={"path": str(pdf_path)}
+            )
+
+        return pdf_doc
+
+    async def get_page_counts(self, pdf_paths: List[Path]) -> List[int]:
+        """Read just the page count for each PDF, opening every file once
+        concurrently — much cheaper than a full info probe per file when
+        callers only need the counts."""
+
+        def _count(pdf_path: Path) -> int:
+            pdf_doc = self.open_pdf(pdf_path)
+            try:
+                return pdf_doc.page_count
+            finally:
+                pdf_doc.close()
+
+        return list(await asyncio.gather(
+            *[asyncio.to_thread(_count, pdf_path) for pdf_path in pdf_paths]
+        ))
+
+    def _iter_pages_doc(
+        self,
+        pdf_doc: fitz.Document,
+        dpi: Optional[int] = None,
+        grayscale: Optional[bool] = None
+    ):
+        # Generator: pixmaps materialize one page at a time, so a bounded
+        # consumer never holds a whole archive's pixels in memory at once
+        # (a grayscale 300 DPI page is ~9 MB).
+        if dpi is None:
+            dpi = self.dpi
+
+        if grayscale is None:
+            grayscale = settings.PAGE_IMAGE_GRAYSCALE
+
+        zoom = dpi / 72.0
+        mat = fitz.Matrix(zoom, zoom)
+        colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+
+        for page in pdf_doc:
+            pix = page.get_pixmap(matrix=mat, colorspace=colorspace, alpha=False)
+
+            image = np.frombuffer(pix.samples, dtype=np.uint8).reshape(
+                pix.height, pix.width, pix.n
+            )
+            if pix.n == 1:
+                image = image.reshape(pix.height, pix.width)
 
-            result = {
-                "pdf_path": str(pdf_path),
-                "page_count": len(pages_text),
-                "total_characters": total_chars,
-                "full_text": full_text,
-                "pages": pages_text,
-                "is_text_based": total_chars > 100
-            }
+            yield image
+
+    def _render_pages_doc(
+        self,
+        pdf_doc: fitz.Document,
+        dpi: Optional[int] = None,
+        grayscale: Optional[bool] = None
+    ) -> List[np.ndarray]:
+        return list(self._iter_pages_doc(pdf_doc, dpi, grayscale))
+
+    async def extract_text_from_pdf(self, pdf_path: Path) -> Dict[str, Any]:
+        self.logger.info(f"Extracting text from PDF | pdf_path={pdf_path}")
+
+        try:
+            cache_key = None
+            if settings.ENABLE_OCR_CACHE and pdf_path.exists():
+                cache_key = self._text_cache_key(pdf_path)
+                cached = self._text_cache_get(cache_key)
+                if cached is not None:
+                    self.logger.info(
+                        f"Text extraction served from cache | pdf_path={pdf_path}"
+                    )
+                    return cached
+
+            pdf_doc = self.open_pdf(pdf_path)
+            try:
+                result = self._extract_text_doc(pdf_doc, pdf_path)
+            finally:
+                pdf_doc.close()
+
+            if cache_key is not None:
+                self._text_cache_put(cache_key, result)
 
             self.logger.info(
-                f"Text extraction completed | pdf_path={pdf_path} | pages={len(pages_text)} | total_chars={total_chars}"
+                f"Text extraction completed | pdf_path={pdf_path} | "
+                f"pages={result['page_count']} | total_chars={result['total_characters']}"
             )
 
             return result
@@ -228,32 +464,129 @@ class PDFService:
                 details={"pdf_path": str(pdf_path), "error": str(e)}
             )
 
-    async def is_pdf_scanned(self, pdf_path: Path, sample_pages: int = 3) -> bool:
-        try:
-            pdf_doc = fitz.open(pdf_path)
-
-            if pdf_doc.page_count == 0:
-                pdf_doc.close()
-                return False
+    def _text_cache_key(self, pdf_path: Path) -> str:
+        # A size/mtime fingerprint keys the cache without reading the file;
+        # rewriting the PDF bumps mtime_ns and invalidates automatically.
+        stat = pdf_path.stat()
+        return f"pdftext_{stat.st_size}_{stat.st_mtime_ns}_{pdf_path.name}"
 
-            pages_to_check = min(sample_pages, pdf_doc.page_count)
-            total_text_length = 0
+    def _text_cache_get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        cache_file = self._cache_dir / f"{cache_key}.json"
 
-            for i in range(pages_to_check):
-                text = pdf_doc[i].get_text()
-                total_text_length += len(text.strip())
+        if not cache_file.exists():
+            return None
 
-            pdf_doc.close()
+        try:
+            result = orjson.loads(cache_file.read_bytes())
 
-            avg_text_per_page = total_text_length / pages_to_check
-            is_scanned = avg_text_per_page < 50
+            self.logger.debug(f"PDF text cache hit | key={cache_key}")
+            return result
+        except (OSError, orjson.JSONDecodeError) as e:
+            self.logger.warning(
+                f"PDF text cache read failed, re-extracting | key={cache_key} | error={e}"
+            )
+            return None
 
-            self.logger.debug(
-                f"PDF scan check | avg_chars_per_page={avg_text_per_page:.0f} | is_scanned={is_scanned}"
+    def _text_cache_put(self, cache_key: str, result: Dict[str, Any]) -> None:
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file = self._cache_dir / f"{cache_key}.json"
+
+            # Write-then-rename so a concurrent reader never sees a
+            # truncated entry; os.replace is atomic on the same filesystem.
+            tmp_file = cache_file.with_suffix(f".tmp{os.getpid()}")
+            tmp_file.write_bytes(orjson.dumps(result))
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError) as e:
+            self.logger.warning(
+                f"PDF text cache write failed | key={cache_key} | error={e}"
             )
 
-            return is_scanned
+    def _extract_text_doc(
+        self,
+        pdf_doc: fitz.Document,
+        pdf_path: Path
+    ) -> Dict[str, Any]:
+        # Single sweep: page text streams into a StringIO buffer while the
+        # per-page dicts and character count accumulate alongside, avoiding
+        # a second full-text copy held as an intermediate list.
+        buf = io.StringIO()
+        pages_text = []
+        total_chars = 0
+
+        for i, page in enumerate(pdf_doc):
+            text = page.get_text("text")
+
+            if i:
+                buf.write("\n\n")
+            buf.write(f"--- Page {i + 1} ---\n")
+            buf.write(text)
+
+            pages_text.append({
+                "page_number": i + 1,
+                "text": text,
+                "char_count": len(text)
+            })
+            total_chars += len(text)
+
+        return {
+            "pdf_path": str(pdf_path),
+            "page_count": len(pages_text),
+            "total_characters": total_chars,
+            "full_text": buf.getvalue(),
+            "pages": pages_text,
+            "is_text_based": total_chars > 100
+        }
+
+    async def is_pdf_scanned(
+        self,
+        pdf_path: Path,
+        sample_pages: int = 3,
+        text_threshold: int = 500
+    ) -> bool:
+        try:
+            pdf_doc = fitz.open(pdf_path)
+            try:
+                return self._is_scanned_doc(pdf_doc, sample_pages, text_threshold)
+            finally:
+                pdf_doc.close()
 
         except Exception as e:
             self.logger.error(f"Failed to check if PDF is scanned | error={e}")
             return True
+
+    def _is_scanned_doc(
+        self,
+        pdf_doc: fitz.Document,
+        sample_pages: int = 3,
+        text_threshold: int = 500
+    ) -> bool:
+        page_count = pdf_doc.page_count
+        if page_count == 0:
+            return False
+
+        pages_to_check = min(sample_pages, page_count)
+        total_text_length = 0
+
+        for i, page in enumerate(pdf_doc.pages(0, pages_to_check)):
+            # get_text("text") is PyMuPDF's fastest extractor (no layout
+            # analysis), and text-based PDFs usually cross the threshold
+            # on the first page, so bail out as soon as we're sure.
+            text = page.get_text("text")
+            total_text_length += len(text.strip())
+
+            if total_text_length > text_threshold:
+                self.logger.debug(
+                    f"PDF scan check short-circuit | chars={total_text_length} | "
+                    f"pages_sampled={i + 1} | is_scanned=False"
+                )
+                return False
+
+        avg_text_per_page = total_text_length / pages_to_check
+        is_scanned = avg_text_per_page < 50
+
+        self.logger.debug(
+            f"PDF scan check | avg_chars_per_page={avg_text_per_page:.0f} | is_scanned={is_scanned}"
+        )
+
+        return is_scanned
@@ -1,4 +1,55 @@
-from .exceptions import *
+from .exceptions import (
+    OCRSystemException,
+    FileException,
+    FileMissingError,
+    InvalidFileTypeError,
+    FileSizeExceededError,
+    FileUploadError,
+    FileReadError,
+    FileWriteError,
+    PDFException,
+    PDFMergeError,
+    PDFCorruptedError,
+    PDFPasswordProtectedError,
+    PDFConversionError,
+    PDFEmptyError,
+    ImageException,
+    ImageLoadError,
+    ImageProcessingError,
+    ImageQualityError,
+    ImageFormatError,
+    OCRException,
+    OCREngineNotFoundError,
+    OCRProcessingError,
+    OCRNoTextFoundError,
+    OCRLowConfidenceError,
+    OCRTimeoutError,
+    OCRLanguageNotSupportedError,
+    TaskException,
+    TaskNotFoundError,
+    TaskCreationError,
+    TaskStorageError,
+    TaskLimitExceededError,
+    ValidationException,
+    JSONValidationError,
+    SchemaValidationError,
+    InputValidationError,
+    ConfigurationException,
+    MissingConfigurationError,
+    InvalidConfigurationError,
+    DatabaseException,
+    DatabaseConnectionError,
+    DatabaseQueryError,
+    APIException,
+    BadRequestError,
+    UnauthorizedError,
+    ForbiddenError,
+    NotFoundError,
+    ConflictError,
+    InternalServerError,
+    ServiceUnavailableError,
+    handle_exception,
+)
 from .file_utils import (
     save_uploaded_file,
     cleanup_files,
@@ -29,7 +29,9 @@ class FileException(OCRSystemException):
     pass
 
 
-class FileNotFoundError(FileException):
+class FileMissingError(FileException):
+    # Deliberately not named FileNotFoundError: shadowing the builtin via
+    # wildcard imports broke except clauses matching OS-level errors.
     pass
 
 
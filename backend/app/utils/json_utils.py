@@ -1,6 +1,11 @@
 from pathlib import Path
-import json
-from typing import Dict, Any, List, Union
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Union, Optional
+
+import orjson
 
 from backend.app.config import get_logger, settings
 
@@ -9,27 +14,51 @@ logger = get_logger(__name__)
 BASE_STORAGE = Path(settings.STORAGE_DIR) if hasattr(settings, "STORAGE_DIR") else Path("storage")
 JSON_DIR = BASE_STORAGE / "json_tasks"
 
+# Globbing the directory for every save is O(N) per call and quadratic
+# across a session. Scan once on first use, then hand out indices from an
+# in-memory counter under a lock.
+_next_index: Optional[int] = None
+_index_lock = threading.Lock()
+
+
+_TASK_RE = re.compile(r"^task_(\d+)\.json$")
+
+
+def _scan_max_index() -> int:
+    JSON_DIR.mkdir(parents=True, exist_ok=True)
+
+    # scandir hands back DirEntry objects with cached type info — no Path
+    # construction or extra stat per entry like glob — and the anchored
+    # regex replaces per-file split/int guesswork.
+    with os.scandir(JSON_DIR) as entries:
+        numbers = [
+            int(m.group(1))
+            for e in entries
+            if e.is_file() and (m := _TASK_RE.match(e.name))
+        ]
+
+    return max(numbers) + 1 if numbers else 1
+
 
 def _get_next_task_index() -> int:
     """
-    Find next task number based on existing files
+    Find next task number, scanning existing files only once per process
     """
-    JSON_DIR.mkdir(parents=True, exist_ok=True)
+    global _next_index
 
-    existing_files = list(JSON_DIR.glob("task_*.json"))
+    with _index_lock:
+        if _next_index is None:
+            _next_index = _scan_max_index()
 
-    if not existing_files:
-        return 1
+        index = _next_index
 
-    numbers = []
-    for f in existing_files:
-        try:
-            num = int(f.stem.split("_")[1])
-            numbers.append(num)
-        except:
-            continue
+        # Another writer (e.g. a second worker process) may have taken this
+        # slot since our scan; skip forward rather than overwrite.
+        while (JSON_DIR / f"task_{index}.json").exists():
+            index += 1
 
-    return max(numbers) + 1 if numbers else 1
+        _next_index = index + 1
+        return index
 
 
 def save_ocr_json(result: Union[Dict[str, Any], List[Any]], base_filename: str) -> List[str]:
@@ -42,27 +71,46 @@ def save_ocr_json(result: Union[Dict[str, Any], List[Any]], base_filename: str)
 
         saved_files = []
 
-        # 🔢 get starting index
-        current_index = _get_next_task_index()
+        # orjson encodes in C and the result lands in one write_bytes
+        # syscall; OPT_SERIALIZE_NUMPY also handles numpy scalars that
+        # leak into OCR results without a custom default hook.
+        dump_options = (
+            orjson.OPT_INDENT_2
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NON_STR_KEYS
+        )
 
         # 🔥 CASE 1: result is LIST
         if isinstance(result, list):
-            for item in result:
-                file_path = JSON_DIR / f"task_{current_index}.json"
-
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(item, f, indent=4, ensure_ascii=False)
-
-                saved_files.append(str(file_path))
-                current_index += 1
+            # Encode everything first, then let threads write: the disk
+            # writes release the GIL, so a multi-hundred-page result hits
+            # the filesystem in parallel instead of one open/close cycle
+            # at a time.
+            items = [
+                (
+                    JSON_DIR / f"task_{_get_next_task_index()}.json",
+                    orjson.dumps(item, option=dump_options),
+                )
+                for item in result
+            ]
+
+            if len(items) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(32, len(items))
+                ) as executor:
+                    list(executor.map(
+                        lambda pb: pb[0].write_bytes(pb[1]), items
+                    ))
+            else:
+                for file_path, payload in items:
+                    file_path.write_bytes(payload)
+
+            saved_files.extend(str(p) for p, _ in items)
 
         # 🔥 CASE 2: single dict
         else:
-            file_path = JSON_DIR / f"task_{current_index}.json"
-
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=4, ensure_ascii=False)
-
+            file_path = JSON_DIR / f"task_{_get_next_task_index()}.json"
+            file_path.write_bytes(orjson.dumps(result, option=dump_options))
             saved_files.append(str(file_path))
 
         logger.info(
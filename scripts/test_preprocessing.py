@@ -1,6 +1,12 @@
 #!/usr/bin/env python3
 import sys
 import asyncio
+import contextvars
+import hashlib
+import io
+import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
 import cv2
 import numpy as np
@@ -9,6 +15,27 @@ import numpy as np
 backend_path = Path(__file__).parent.parent / 'backend'
 sys.path.insert(0, str(backend_path))
 
+# Each gathered test prints into its own StringIO and the runner flushes
+# it with one stdout write per test: that drops hundreds of line-buffered
+# write syscalls and keeps concurrent tests from interleaving output.
+# The buffer rides a contextvar so prints from asyncio.to_thread workers
+# (which copy the task context) land in the right test's buffer too.
+_test_buf = contextvars.ContextVar("test_buf", default=None)
+_real_stdout = sys.stdout
+
+
+class _BufferedStdout(io.TextIOBase):
+    def write(self, s):
+        buf = _test_buf.get()
+        return (buf if buf is not None else _real_stdout).write(s)
+
+    def flush(self):
+        if _test_buf.get() is None:
+            _real_stdout.flush()
+
+
+sys.stdout = _BufferedStdout()
+
 from backend.app.core.image_processors import (
     ImageEnhancer,
     ImageDenoiser,
@@ -18,10 +45,31 @@ from backend.app.core.image_processors import (
 from backend.app.services.preprocessing_service import PreprocessingService
 from backend.app.utils.file_utils import save_image, load_image
 
+# The processors and service hold only configuration, so one instance per
+# module serves every test; the service also reuses its compiled-pipeline
+# cache across tests this way.
+_enhancer = ImageEnhancer()
+_denoiser = ImageDenoiser()
+_deskewer = ImageDeskewer()
+_binarizer = ImageBinarizer()
+_prep_service = PreprocessingService()
+
+
+# Noise generation reuses one float32 scratch buffer: float64 noise plus
+# the uint8 upcast would move ~8x the bytes of the source frame through
+# memory on every call. Seeded so repeat runs produce identical images.
+# The tests run gathered and call create_test_image off-thread, so the
+# shared scratch and generator sit behind a lock.
+_rng = np.random.default_rng(42)
+_noise_scratch = np.empty((400, 800, 3), dtype=np.float32)
+_noise_lock = threading.Lock()
 
-def create_test_image(noise_level: float = 0.05, skew_angle: float = 5.0):
-    img = np.ones((400, 800, 3), dtype=np.uint8) * 255
 
+# The four test strings never change, so the text layer is rendered once
+# at import; create_test_image then starts from a single memcpy instead
+# of four cv2.putText rasterization passes per call.
+def _render_text_layer() -> np.ndarray:
+    img = np.full((400, 800, 3), 255, dtype=np.uint8)
 
     font = cv2.FONT_HERSHEY_SIMPLEX
     texts = [
@@ -34,10 +82,23 @@ def create_test_image(noise_level: float = 0.05, skew_angle: float = 5.0):
     for text, pos, scale in texts:
         cv2.putText(img, text, pos, font, scale, (0, 0, 0), 2)
 
+    return img
+
+
+_TEXT_LAYER = _render_text_layer()
+
+
+def create_test_image(noise_level: float = 0.05, skew_angle: float = 5.0):
+    img = _TEXT_LAYER.copy()
+
 
     if noise_level > 0:
-        noise = np.random.normal(0, noise_level * 255, img.shape)
-        img = np.clip(img + noise, 0, 255).astype(np.uint8)
+        with _noise_lock:
+            _rng.standard_normal(out=_noise_scratch, dtype=np.float32)
+            np.multiply(_noise_scratch, noise_level * 255, out=_noise_scratch)
+            np.add(_noise_scratch, img, out=_noise_scratch)
+            np.clip(_noise_scratch, 0, 255, out=_noise_scratch)
+            img = _noise_scratch.astype(np.uint8)
 
 
     if abs(skew_angle) > 0:
@@ -49,13 +110,45 @@ def create_test_image(noise_level: float = 0.05, skew_angle: float = 5.0):
     return img
 
 
+# Denoising dominates this suite (NLM alone costs hundreds of
+# milliseconds), so repeat runs over the same frame are memoized. The key
+# hashes the pixel bytes with blake2b — at memory bandwidth the hash is
+# ~1 ms on a 400x800x3 frame, free next to the filters it skips — and an
+# OrderedDict LRU caps the retained results.
+_denoise_cache = OrderedDict()
+_DENOISE_CACHE_MAX = 64
+_denoise_cache_lock = threading.Lock()
+
+
+def _cached_denoise_batch(img, methods):
+    key = (
+        tuple(methods),
+        hashlib.blake2b(img.tobytes(), digest_size=16).hexdigest()
+    )
+
+    with _denoise_cache_lock:
+        cached = _denoise_cache.get(key)
+        if cached is not None:
+            _denoise_cache.move_to_end(key)
+            return cached
+
+    results = _denoiser.denoise_batch(img, methods)
+
+    with _denoise_cache_lock:
+        _denoise_cache[key] = results
+        if len(_denoise_cache) > _DENOISE_CACHE_MAX:
+            _denoise_cache.popitem(last=False)
+
+    return results
+
+
 async def test_enhancer():
     print("\n" + "=" * 60)
     print("TEST 1: Image Enhancement")
     print("=" * 60)
 
     try:
-        enhancer = ImageEnhancer()
+        enhancer = _enhancer
 
 
         img = np.ones((200, 400), dtype=np.uint8) * 128
@@ -66,8 +159,8 @@ async def test_enhancer():
 
         methods = ["auto", "clahe", "histogram", "sharpen", "gamma"]
 
-        for method in methods:
-            enhanced = enhancer.enhance(img, method=method)
+        results = await asyncio.to_thread(enhancer.enhance_batch, img, methods)
+        for method, enhanced in results.items():
             print(f"   ✓ {method.upper()}: Enhanced successfully")
 
 
@@ -95,19 +188,17 @@ async def test_denoiser():
     print("=" * 60)
 
     try:
-        denoiser = ImageDenoiser()
+        denoiser = _denoiser
 
 
-        img = create_test_image(noise_level=0.1, skew_angle=0)
+        img = await asyncio.to_thread(create_test_image, noise_level=0.1, skew_angle=0)
 
         print("\n1. Testing Denoising Methods:")
 
         methods = ["auto", "gaussian", "median", "bilateral", "nlm"]
 
-        for method in methods:
-            if method == "nlm":
-                print(f"   ⏳ {method.upper()}: Processing (slow)...")
-            denoised = denoiser.denoise(img, method=method)
+        results = await asyncio.to_thread(_cached_denoise_batch, img, methods)
+        for method, denoised in results.items():
             print(f"   ✓ {method.upper()}: Denoised successfully")
 
         print("\n2. Testing Noise Estimation:")
@@ -130,11 +221,13 @@ async def test_deskewer():
     print("=" * 60)
 
     try:
-        deskewer = ImageDeskewer()
+        deskewer = _deskewer
 
 
         skew_angle = 8.0
-        img = create_test_image(noise_level=0.02, skew_angle=skew_angle)
+        img = await asyncio.to_thread(
+            create_test_image, noise_level=0.02, skew_angle=skew_angle
+        )
 
         print(f"\n1. Original Skew: {skew_angle}°")
 
@@ -154,7 +247,7 @@ async def test_deskewer():
                 print(f"   ⚠ {method.upper()}: {str(e)[:50]}")
 
         print("\n3. Testing Auto Deskewing:")
-        deskewed, angle = deskewer.deskew(img, method="auto")
+        deskewed, angle = await asyncio.to_thread(deskewer.deskew, img, method="auto")
         print(f"   ✓ Auto deskew - detected: {angle:.2f}°, corrected successfully")
         print(f"   ✓ Deskewed image shape: {deskewed.shape}")
 
@@ -173,17 +266,19 @@ async def test_binarizer():
     print("=" * 60)
 
     try:
-        binarizer = ImageBinarizer()
+        binarizer = _binarizer
 
 
-        img = create_test_image(noise_level=0.03, skew_angle=0)
+        img = await asyncio.to_thread(create_test_image, noise_level=0.03, skew_angle=0)
 
         print("\n1. Testing Binarization Methods:")
 
         methods = ["auto", "otsu", "adaptive", "sauvola", "niblack", "triangle"]
 
-        for method in methods:
-            binary = binarizer.binarize(img, method=method)
+        # One call converts to grayscale once and shares the local-stat
+        # maps between sauvola and niblack.
+        results = await asyncio.to_thread(binarizer.binarize_batch, img, methods)
+        for method, binary in results.items():
             unique_values = len(np.unique(binary))
             print(f"   ✓ {method.upper()}: Binarized (unique values: {unique_values})")
 
@@ -210,48 +305,57 @@ async def test_preprocessing_service():
     print("=" * 60)
 
     try:
-        service = PreprocessingService()
+        service = _prep_service
 
+        # Artifacts live in a TemporaryDirectory so a failing run cannot
+        # leave stray files behind.
+        with tempfile.TemporaryDirectory(prefix="preproc_test_") as td:
+            img = await asyncio.to_thread(create_test_image, noise_level=0.05, skew_angle=5.0)
+            test_path = Path(td) / "preprocessing.png"
+            save_image(img, test_path)
+            print(f"\n1. Created test image: {test_path}")
 
-        img = create_test_image(noise_level=0.05, skew_angle=5.0)
-        test_path = Path("test_preprocessing.png")
-        save_image(img, test_path)
-        print(f"\n1. Created test image: {test_path}")
 
+            info = service.get_preprocessing_info()
+            print(f"\n2. Preprocessing Info:")
+            print(f"   Enabled: {info['enabled']}")
+            print(f"   DPI: {info['dpi']}")
+            print(f"   Available methods: {len(info['available_methods'])}")
 
-        info = service.get_preprocessing_info()
-        print(f"\n2. Preprocessing Info:")
-        print(f"   Enabled: {info['enabled']}")
-        print(f"   DPI: {info['dpi']}")
-        print(f"   Available methods: {len(info['available_methods'])}")
 
-
-        print(f"\n3. Testing Full Preprocessing Pipeline:")
-        processed_path = await service.preprocess_image(
-            test_path,
-            enhance=True,
-            denoise=True,
-            deskew=True,
-            binarize=True
-        )
-        print(f"   ✓ Preprocessed image saved: {processed_path}")
+            print(f"\n3. Testing Full Preprocessing Pipeline:")
+            processed_path = await service.preprocess_image(
+                test_path,
+                enhance=True,
+                denoise=True,
+                deskew=True,
+                binarize=True
+            )
+            print(f"   ✓ Preprocessed image saved: {processed_path}")
 
 
-        print(f"\n4. Testing Document Type Presets:")
-        doc_types = ["general", "form", "handwritten", "low_quality", "photo"]
+            print(f"\n4. Testing Document Type Presets:")
+            doc_types = ["general", "form", "handwritten", "low_quality", "photo"]
 
-        for doc_type in doc_types:
+            # One batched call: the service loads the image once and runs
+            # each unique preset pipeline a single time for all five types.
             try:
-                result = await service.preprocess_for_ocr(test_path, doc_type)
-                print(f"   ✓ {doc_type.upper()}: Preprocessed successfully")
+                preset_results = await service.preprocess_for_ocr_batch(
+                    test_path, doc_types
+                )
+                for doc_type in doc_types:
+                    print(f"   ✓ {doc_type.upper()}: Preprocessed successfully")
             except Exception as e:
-                print(f"   ⚠ {doc_type.upper()}: {str(e)[:50]}")
+                print(f"   ⚠ Preset batch failed: {str(e)[:50]}")
+                preset_results = {}
 
+            for preset_path in set(preset_results.values()):
+                if preset_path != test_path and preset_path.exists():
+                    preset_path.unlink()
 
-        if test_path.exists():
-            test_path.unlink()
-        if processed_path.exists():
-            processed_path.unlink()
+
+            if processed_path.exists():
+                processed_path.unlink()
 
         print(f"\n5. Cleanup completed")
 
@@ -272,31 +376,31 @@ async def test_full_pipeline_visual():
     try:
 
         print("\n1. Creating degraded test image...")
-        img = create_test_image(noise_level=0.08, skew_angle=7.0)
+        img = await asyncio.to_thread(create_test_image, noise_level=0.08, skew_angle=7.0)
 
 
-        enhancer = ImageEnhancer()
-        denoiser = ImageDenoiser()
-        deskewer = ImageDeskewer()
-        binarizer = ImageBinarizer()
+        enhancer = _enhancer
+        denoiser = _denoiser
+        deskewer = _deskewer
+        binarizer = _binarizer
 
 
         print("\n2. Applying Preprocessing Steps:")
 
 
-        enhanced = enhancer.enhance(img, method="clahe")
+        enhanced = await asyncio.to_thread(enhancer.enhance, img, method="clahe")
         print("   ✓ Step 1: Enhanced (CLAHE)")
 
 
-        denoised = denoiser.denoise(enhanced, method="bilateral")
+        denoised = await asyncio.to_thread(denoiser.denoise, enhanced, method="bilateral")
         print("   ✓ Step 2: Denoised (Bilateral)")
 
 
-        deskewed, angle = deskewer.deskew(denoised, method="hough")
+        deskewed, angle = await asyncio.to_thread(deskewer.deskew, denoised, method="hough")
         print(f"   ✓ Step 3: Deskewed (angle: {angle:.2f}°)")
 
 
-        binarized = binarizer.binarize(deskewed, method="sauvola")
+        binarized = await asyncio.to_thread(binarizer.binarize, deskewed, method="sauvola")
         print("   ✓ Step 4: Binarized (Sauvola)")
 
         print(f"\n3. Pipeline Results:")
@@ -328,18 +432,23 @@ async def main():
         ("Full Pipeline Visual", test_full_pipeline_visual),
     ]
 
-    results = []
-
-    for test_name, test_func in tests:
+    # Independent tests run concurrently; the service-backed ones await
+    # real work and overlap, the pure-CPU ones interleave at await points.
+    async def run_one(test_name, test_func):
+        buf = io.StringIO()
+        _test_buf.set(buf)
         try:
-            result = await test_func()
-            results.append((test_name, result))
-        except KeyboardInterrupt:
-            print("\n\n⚠️  Tests interrupted by user")
-            break
+            result = test_name, await test_func()
         except Exception as e:
             print(f"\n✗ {test_name} crashed: {e}")
-            results.append((test_name, False))
+            result = test_name, False
+        _test_buf.set(None)
+        _real_stdout.write(buf.getvalue())
+        return result
+
+    results = list(await asyncio.gather(
+        *[run_one(test_name, test_func) for test_name, test_func in tests]
+    ))
 
 
     print("\n" + "=" * 60)
@@ -372,5 +481,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    try:
+        exit_code = asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Tests interrupted by user")
+        exit_code = 1
     sys.exit(exit_code)
\ No newline at end of file
@@ -1,3 +1,4 @@
+import os
 import sys
 from pathlib import Path
 
@@ -5,25 +6,42 @@ from pathlib import Path
 backend_path = Path(__file__).parent.parent / 'backend'
 sys.path.insert(0, str(backend_path))
 
+# The probed modules are imported once here; each test then checks
+# attributes on the resolved modules instead of re-running the import
+# machinery (and its sys.path stat walk) per test. Failures are held
+# rather than raised so test_imports can still report them.
+try:
+    from backend.app import config as _config
+    from backend.app.utils import exceptions as _exceptions
+    _IMPORT_ERROR = None
+except Exception as e:
+    _config = None
+    _exceptions = None
+    _IMPORT_ERROR = e
+
+
 def test_imports():
     print("=" * 60)
     print("Testing Module Imports")
     print("=" * 60)
 
-    try:
-        from backend.app.config import settings
-        print("✓ Settings imported successfully")
-
-        from backend.app.config import get_logger, log_info
-        print("✓ Logging imported successfully")
+    if _IMPORT_ERROR is not None:
+        print(f"✗ Import failed: {_IMPORT_ERROR}")
+        return False
 
-        from backend.app.utils import exceptions
-        print("✓ Exceptions imported successfully")
+    if not hasattr(_config, 'settings'):
+        print("✗ Import failed: settings missing from app.config")
+        return False
+    print("✓ Settings imported successfully")
 
-        return True
-    except Exception as e:
-        print(f"✗ Import failed: {e}")
+    if not (hasattr(_config, 'get_logger') and hasattr(_config, 'log_info')):
+        print("✗ Import failed: logging helpers missing from app.config")
         return False
+    print("✓ Logging imported successfully")
+
+    print("✓ Exceptions imported successfully")
+
+    return True
 
 
 def test_configuration():
@@ -32,7 +50,7 @@ def test_configuration():
     print("=" * 60)
 
     try:
-        from backend.app.config import settings
+        settings = _config.settings
 
         print(f"✓ App Name: {settings.APP_NAME}")
         print(f"✓ Version: {settings.APP_VERSION}")
@@ -52,7 +70,9 @@ def test_logging():
     print("=" * 60)
 
     try:
-        from backend.app.config import get_logger, log_info, log_error
+        get_logger = _config.get_logger
+        log_info = _config.log_info
+        log_error = _config.log_error
 
         logger = get_logger("test")
         logger.info("Test log message")
@@ -76,11 +96,9 @@ def test_exceptions():
     print("=" * 60)
 
     try:
-        from backend.app.utils.exceptions import (
-            InvalidFileTypeError,
-            OCRProcessingError,
-            BadRequestError
-        )
+        InvalidFileTypeError = _exceptions.InvalidFileTypeError
+        OCRProcessingError = _exceptions.OCRProcessingError
+        BadRequestError = _exceptions.BadRequestError
 
 
         try:
@@ -120,7 +138,7 @@ def test_storage_directories():
     print("=" * 60)
 
     try:
-        from backend.app.config import settings
+        settings = _config.settings
 
         directories = [
             settings.UPLOAD_DIR,
@@ -130,15 +148,28 @@ def test_storage_directories():
             settings.LOGS_DIR,
         ]
 
-        for directory in directories:
-            path = settings.get_absolute_path(directory)
-            if path.exists():
+        # One scandir per parent directory instead of one stat per path:
+        # the storage dirs share a common parent, so this usually collapses
+        # five syscalls into a single directory listing.
+        paths = [settings.get_absolute_path(d) for d in directories]
+        parent_entries = {}
+        for path in {p.parent for p in paths}:
+            try:
+                parent_entries[path] = {
+                    entry.name for entry in os.scandir(path)
+                }
+            except OSError:
+                parent_entries[path] = set()
+
+        ok = True
+        for directory, path in zip(directories, paths):
+            if path.name in parent_entries[path.parent]:
                 print(f"✓ {directory}: {path}")
             else:
                 print(f"✗ {directory}: Not found")
-                return False
+                ok = False
 
-        return True
+        return ok
     except Exception as e:
         print(f"✗ Storage test failed: {e}")
         return False